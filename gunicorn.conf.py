@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+"""
+Gunicorn settings for serving the standalone DebtSweeper dashboard.
+
+Run from the repository root with: gunicorn standalone_app:app
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5050')}"
+
+# Threaded workers overlap the I/O-bound upload, extraction and download requests
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Import the app once in the master so the compiled templates, pre-rendered pages
+# and compressed assets are shared copy-on-write with every forked worker. Preloading
+# is also what lets several workers serve one scan: the upload folder is created at
+# import, so every worker extracts into and reads from the same directory. Keep it
+# enabled whenever workers > 1.
+preload_app = True
@@ -6,21 +6,90 @@ Standalone Flask dashboard for DebtSweeper with embedded templates and CSS.
 
 Provides a web interface for visualizing debt scores and managing fixes.
 Everything is embedded in this single file for easy deployment.
+
+Run ``python standalone_app.py`` for local development, or
+``gunicorn standalone_app:app`` (configured by gunicorn.conf.py) in production.
 """
 
 import os
-import json
+import atexit
+import decimal
+import functools
+import gzip
+import hashlib
+import io
+import re
+import shutil
+import stat
 import tempfile
+import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
 
-from flask import Flask, request, jsonify, send_file, redirect, url_for
+from flask import Flask, Request, Response, request, jsonify, send_file, url_for
+from flask.json.provider import JSONProvider
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, TemplateNotFound, select_autoescape
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip variants are always available
+    brotli = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; Flask's stdlib JSON provider is used instead
+    orjson = None
+
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson that writes response bodies as bytes."""
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS if orjson else 0
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, (decimal.Decimal, uuid.UUID)):
+            return str(o)
+        if hasattr(o, '__html__'):
+            return str(o.__html__())
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.option)
+        return self._app.response_class(body, mimetype='application/json')
+
+
+UPLOAD_SPOOL_THRESHOLD = 500 * 1024  # Werkzeug's in-memory limit for form file parts
+UPLOAD_WRITE_BUFFER = 512 * 1024  # Batches the parser's 64KB chunks into fewer write() calls
+
+
+class UploadRequest(Request):
+    """Request that spools large file uploads straight to disk through a wide buffer."""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        if total_content_length is not None and total_content_length <= UPLOAD_SPOOL_THRESHOLD:
+            return io.BytesIO()
+        return tempfile.TemporaryFile('wb+', buffering=UPLOAD_WRITE_BUFFER)
+
 
 # Create Flask app
 app = Flask(__name__)
+app.request_class = UploadRequest
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+else:
+    app.json.compact = True  # Never pretty-print JSON, even under the debug server
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max upload size
-app.config['UPLOAD_FOLDER'] = tempfile.mkdtemp()
+app.config['UPLOAD_FOLDER'] = tempfile.mkdtemp(prefix='ds_')  # Created before fork so every worker shares it
+app.config.update(TEMPLATES_AUTO_RELOAD=False, EXPLAIN_TEMPLATE_LOADING=False)  # Templates are embedded
 
 # CSS styles as string
 CSS = """/* DebtSweeper High-Tech Theme */
@@ -132,7 +201,6 @@ body {
   );
   transform: rotate(45deg);
   z-index: 1;
-  animation: grid-animation 20s linear infinite;
 }
 
 .hero h1 {
@@ -149,23 +217,14 @@ body {
   opacity: 0.9;
 }
 
-@keyframes grid-animation {
-  0% {
-    transform: translateX(-50px) rotate(45deg);
-  }
-  100% {
-    transform: translateX(50px) rotate(45deg);
-  }
-}
-
 /* Cards with high-tech look */
 .card {
   background: rgba(255, 255, 255, 0.05);
   border: 1px solid rgba(255, 255, 255, 0.1);
   border-radius: 10px;
-  backdrop-filter: blur(10px);
   box-shadow: var(--box-shadow);
   transition: var(--transition);
+  contain: layout paint style;
 }
 
 .card-header {
@@ -231,14 +290,14 @@ body {
 @keyframes card-shine {
   0% {
     opacity: 0;
-    left: -50%;
+    transform: translateX(0) rotate(30deg);
   }
   50% {
     opacity: 1;
   }
   100% {
     opacity: 0;
-    left: 150%;
+    transform: translateX(100%) rotate(30deg);
   }
 }
 
@@ -290,7 +349,7 @@ body {
 
 @keyframes btn-shine {
   100% {
-    left: 200%;
+    transform: translateX(300%);
   }
 }
 
@@ -351,7 +410,22 @@ footer {
 
 @keyframes progress-shine {
   100% {
-    left: 200%;
+    transform: translateX(300%);
+  }
+}
+
+/* Keep the animated overlays on their own compositor layer */
+.debt-card::after,
+.progress-bar::after,
+.btn-primary::before {
+  will-change: transform;
+}
+
+@media (prefers-reduced-motion: reduce) {
+  .debt-card:hover::after,
+  .progress-bar::after,
+  .btn-primary:hover::before {
+    animation: none;
   }
 }
 
@@ -363,7 +437,9 @@ pre {
   padding: 1rem;
   font-family: 'JetBrains Mono', monospace;
   position: relative;
-  overflow: hidden;
+  max-height: 400px;
+  overflow-x: hidden;
+  overflow-y: auto;
 }
 
 pre::before {
@@ -463,6 +539,30 @@ pre::before {
 }
 """
 
+
+def minify_css(css):
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+
+# Shared stylesheet served as a separate, fingerprinted asset so browsers cache it once
+CSS_BYTES = minify_css(CSS).encode('utf-8')
+CSS_FINGERPRINT = hashlib.sha1(CSS_BYTES).hexdigest()[:12]
+CSS_URL = f'/assets/debtsweeper.{CSS_FINGERPRINT}.css'
+
+# Steps listed in the "How It Works" section of the homepage
+HOW_IT_WORKS_STEPS = (
+    "Upload your Python codebase as a zip file.",
+    "DebtSweeper analyzes code structure and patterns to identify technical debt.",
+    "Review debt items and their severity scores in an interactive dashboard.",
+    "Select debt items to fix and get AI-generated refactoring suggestions.",
+    "Apply patches to your codebase manually or through GitHub PRs.",
+)
+
 # HTML templates as dictionaries
 TEMPLATES = {
     'index.html': '''<!DOCTYPE html>
@@ -473,12 +573,12 @@ TEMPLATES = {
     <title>DebtSweeper Dashboard</title>
     <!-- Bootstrap CSS -->
     <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/css/bootstrap.min.css" rel="stylesheet">
-    <!-- Google Fonts -->
+    <!-- Google Fonts (font files live on a second origin, so connect to both early) -->
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@300;400;500;700&display=swap" rel="stylesheet">
     <!-- Custom CSS -->
-    <style>
-    {{css}}
-    </style>
+    <link href="{{ css_url }}" rel="stylesheet">
 </head>
 <body>
     <div class="hero text-center">
@@ -542,26 +642,12 @@ TEMPLATES = {
         <div class="row">
             <div class="col-12">
                 <h2>How It Works</h2>
-                <div class="d-flex align-items-center mb-3">
-                    <div class="bg-primary text-white rounded-circle d-flex align-items-center justify-content-center" style="width: 40px; height: 40px;">1</div>
-                    <div class="ms-3">Upload your Python codebase as a zip file.</div>
-                </div>
-                <div class="d-flex align-items-center mb-3">
-                    <div class="bg-primary text-white rounded-circle d-flex align-items-center justify-content-center" style="width: 40px; height: 40px;">2</div>
-                    <div class="ms-3">DebtSweeper analyzes code structure and patterns to identify technical debt.</div>
-                </div>
-                <div class="d-flex align-items-center mb-3">
-                    <div class="bg-primary text-white rounded-circle d-flex align-items-center justify-content-center" style="width: 40px; height: 40px;">3</div>
-                    <div class="ms-3">Review debt items and their severity scores in an interactive dashboard.</div>
-                </div>
-                <div class="d-flex align-items-center mb-3">
-                    <div class="bg-primary text-white rounded-circle d-flex align-items-center justify-content-center" style="width: 40px; height: 40px;">4</div>
-                    <div class="ms-3">Select debt items to fix and get AI-generated refactoring suggestions.</div>
-                </div>
-                <div class="d-flex align-items-center">
-                    <div class="bg-primary text-white rounded-circle d-flex align-items-center justify-content-center" style="width: 40px; height: 40px;">5</div>
-                    <div class="ms-3">Apply patches to your codebase manually or through GitHub PRs.</div>
+                {% for step in how_it_works_steps %}
+                <div class="d-flex align-items-center{% if not loop.last %} mb-3{% endif %}">
+                    <div class="bg-primary text-white rounded-circle d-flex align-items-center justify-content-center" style="width: 40px; height: 40px;">{{ loop.index }}</div>
+                    <div class="ms-3">{{ step }}</div>
                 </div>
+                {% endfor %}
             </div>
         </div>
     </div>
@@ -573,7 +659,7 @@ TEMPLATES = {
     </footer>
 
     <!-- Bootstrap JS and dependencies -->
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/js/bootstrap.bundle.min.js"></script>
+    <script defer src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/js/bootstrap.bundle.min.js"></script>
 </body>
 </html>
 ''',
@@ -586,11 +672,13 @@ TEMPLATES = {
     <title>Repository Scan - DebtSweeper</title>
     <!-- Bootstrap CSS -->
     <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/css/bootstrap.min.css" rel="stylesheet">
-    <!-- Google Fonts -->
+    <!-- Google Fonts (font files live on a second origin, so connect to both early) -->
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@300;400;500;700&display=swap" rel="stylesheet">
     <!-- Custom CSS -->
+    <link href="{{ css_url }}" rel="stylesheet">
     <style>
-    {{css}}
     .progress-container {
         display: none;
     }
@@ -698,7 +786,7 @@ TEMPLATES = {
                 </div>
                 <div class="card-body">
                     <div id="debt-by-type" class="row">
-                        <!-- Will be populated by JavaScript -->
+                        <!-- Filled with the server-rendered fragment from the scan response -->
                     </div>
                 </div>
             </div>
@@ -728,7 +816,7 @@ TEMPLATES = {
     </footer>
 
     <!-- Bootstrap JS and dependencies -->
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/js/bootstrap.bundle.min.js"></script>
+    <script defer src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/js/bootstrap.bundle.min.js"></script>
     
     <!-- Page-specific JavaScript -->
     <script>
@@ -737,10 +825,25 @@ TEMPLATES = {
             const uploadContainer = document.querySelector('.upload-container');
             const progressContainer = document.querySelector('.progress-container');
             const resultsContainer = document.querySelector('.results-container');
+            const repoScoreEl = document.getElementById('repo-score');
+            const totalDebtItemsEl = document.getElementById('total-debt-items');
+            const totalLocEl = document.getElementById('total-loc');
+            const debtByTypeContainer = document.getElementById('debt-by-type');
+            const numberFormat = new Intl.NumberFormat();  // Reused: toLocaleString() builds a formatter per call
+            const submitButton = form.querySelector('[type="submit"]');
+            let scanController = null;
             
             form.addEventListener('submit', function(e) {
                 e.preventDefault();
                 
+                // Cancel any scan still in flight so only the latest response updates the page
+                if (scanController) {
+                    scanController.abort();
+                }
+                const controller = new AbortController();
+                scanController = controller;
+                submitButton.disabled = true;
+                
                 // Show progress indicator
                 uploadContainer.style.display = 'none';
                 progressContainer.style.display = 'block';
@@ -751,7 +854,8 @@ TEMPLATES = {
                 // Send AJAX request
                 fetch('/scan', {
                     method: 'POST',
-                    body: formData
+                    body: formData,
+                    signal: controller.signal
                 })
                 .then(response => {
                     if (!response.ok) {
@@ -760,51 +864,42 @@ TEMPLATES = {
                     return response.json();
                 })
                 .then(data => {
-                    // Hide progress indicator
-                    progressContainer.style.display = 'none';
-                    
-                    // Update results
-                    document.getElementById('repo-score').textContent = data.repo_score.toFixed(2);
-                    document.getElementById('total-debt-items').textContent = data.total_debt_items;
-                    document.getElementById('total-loc').textContent = data.total_loc.toLocaleString();
-                    
-                    // Update debt by type
-                    const debtByTypeContainer = document.getElementById('debt-by-type');
-                    debtByTypeContainer.innerHTML = '';
+                    // Format everything up front, then apply all DOM writes in one frame
+                    const repoScore = data.repo_score.toFixed(2);
+                    const totalLoc = numberFormat.format(data.total_loc);
                     
-                    for (const [type, count] of Object.entries(data.items_by_type)) {
-                        const debtTypeHTML = `
-                            <div class="col-md-4 mb-3">
-                                <div class="card h-100">
-                                    <div class="card-body">
-                                        <h5 class="card-title">${formatDebtType(type)}</h5>
-                                        <p class="card-text">${count} issues</p>
-                                    </div>
-                                </div>
-                            </div>
-                        `;
-                        debtByTypeContainer.innerHTML += debtTypeHTML;
-                    }
-                    
-                    // Show results
-                    resultsContainer.style.display = 'block';
+                    requestAnimationFrame(() => {
+                        // Hide progress indicator
+                        progressContainer.style.display = 'none';
+                        
+                        // Update results
+                        repoScoreEl.textContent = repoScore;
+                        totalDebtItemsEl.textContent = data.total_debt_items;
+                        totalLocEl.textContent = totalLoc;
+                        debtByTypeContainer.innerHTML = data.html_fragment;
+                        
+                        // Show results
+                        resultsContainer.style.display = 'block';
+                    });
                 })
                 .catch(error => {
+                    if (error.name === 'AbortError') {
+                        return;
+                    }
                     console.error('Error:', error);
                     alert('An error occurred while scanning the repository. Please try again.');
                     
                     // Reset UI
                     progressContainer.style.display = 'none';
                     uploadContainer.style.display = 'block';
+                })
+                .finally(() => {
+                    if (scanController === controller) {
+                        scanController = null;
+                        submitButton.disabled = false;
+                    }
                 });
             });
-            
-            // Helper function to format debt type
-            function formatDebtType(type) {
-                return type.split('_')
-                    .map(word => word.charAt(0).toUpperCase() + word.slice(1))
-                    .join(' ');
-            }
         });
     </script>
 </body>
@@ -819,13 +914,15 @@ TEMPLATES = {
     <title>{{ file_path }} - DebtSweeper</title>
     <!-- Bootstrap CSS -->
     <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/css/bootstrap.min.css" rel="stylesheet">
-    <!-- Google Fonts -->
+    <!-- Google Fonts (font files live on a second origin, so connect to both early) -->
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@300;400;500;700&display=swap" rel="stylesheet">
     <!-- Prism.js for syntax highlighting -->
     <link href="https://cdnjs.cloudflare.com/ajax/libs/prism/1.24.1/themes/prism-tomorrow.min.css" rel="stylesheet">
     <!-- Custom CSS -->
+    <link href="{{ css_url }}" rel="stylesheet">
     <style>
-    {{css}}
     .debt-item {
         cursor: pointer;
         border-left: 4px solid var(--danger-color);
@@ -834,9 +931,13 @@ TEMPLATES = {
     .debt-item:hover {
         background-color: rgba(232, 65, 24, 0.1);
     }
-    pre {
-        max-height: 400px;
-        overflow-y: auto;
+    .debt-item {
+        content-visibility: auto;
+        contain-intrinsic-size: auto 120px;
+    }
+    #suggestFixesModal .list-group-item {
+        content-visibility: auto;
+        contain-intrinsic-size: auto 42px;
     }
     </style>
 </head>
@@ -914,7 +1015,7 @@ TEMPLATES = {
                 <h5 class="mb-0">Debt Items</h5>
             </div>
             <div class="card-body">
-                <div class="list-group">
+                <div class="list-group" id="debt-item-list">
                     {% for item in debt_items %}
                     <div class="list-group-item debt-item" data-debt-id="{{ loop.index0 }}">
                         <div class="d-flex w-100 justify-content-between">
@@ -990,10 +1091,10 @@ TEMPLATES = {
     </footer>
 
     <!-- Bootstrap JS -->
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/js/bootstrap.bundle.min.js"></script>
+    <script defer src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/js/bootstrap.bundle.min.js"></script>
     <!-- Prism.js for syntax highlighting -->
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/prism/1.24.1/components/prism-core.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/prism/1.24.1/plugins/autoloader/prism-autoloader.min.js"></script>
+    <script defer src="https://cdnjs.cloudflare.com/ajax/libs/prism/1.24.1/components/prism-core.min.js"></script>
+    <script defer src="https://cdnjs.cloudflare.com/ajax/libs/prism/1.24.1/plugins/autoloader/prism-autoloader.min.js"></script>
     
     <script>
         document.addEventListener('DOMContentLoaded', function() {
@@ -1031,24 +1132,67 @@ TEMPLATES = {
                 });
             });
             
-            // Highlight debt items in code
-            const debtItems = document.querySelectorAll('.debt-item');
+            // Highlight debt items in code (one delegated listener for the whole list)
+            const debtItemList = document.getElementById('debt-item-list');
             
-            debtItems.forEach(item => {
-                item.addEventListener('click', function() {
-                    const debtId = this.dataset.debtId;
+            if (debtItemList) {
+                debtItemList.addEventListener('click', function(e) {
+                    const item = e.target.closest('.debt-item');
+                    if (!item) {
+                        return;
+                    }
+                    const debtId = item.dataset.debtId;
                     // TODO: Implement code highlighting based on line numbers
                     console.log('Clicked on debt item', debtId);
                 });
-            });
+            }
         });
     </script>
 </body>
 </html>
+''',
+
+    '_debt_by_type.html': '''{% for type, count in items_by_type.items() %}
+<div class="col-md-4 mb-3">
+    <div class="card h-100">
+        <div class="card-body">
+            <h5 class="card-title">{{ type.replace('_', ' ').title() }}</h5>
+            <p class="card-text">{{ count }} issues</p>
+        </div>
+    </div>
+</div>
+{% endfor %}
 '''
 }
 
 # Mock implementations for Debt Sweeper modules
+
+# Mock analysis results shared by every request; treat them as read-only
+MOCK_ITEMS_BY_TYPE = {
+    "long_function": 12,
+    "high_complexity": 8,
+    "code_duplication": 5,
+    "unused_imports": 7,
+    "poor_naming": 10
+}
+
+MOCK_DEBT_ITEMS = (
+    {
+        "debt_type": "long_function",
+        "message": "Function is too long (50 lines)",
+        "line_start": 10,
+        "line_end": 60,
+        "severity": 0.8
+    },
+    {
+        "debt_type": "high_complexity",
+        "message": "Function has high cyclomatic complexity (15)",
+        "line_start": 25,
+        "line_end": 40,
+        "severity": 0.7
+    },
+)
+
 class DebtScorer:
     def score_file(self, file_path, debt_items, loc):
         return FileScore(file_path, debt_items, loc)
@@ -1057,6 +1201,8 @@ class DebtScorer:
         return RepoScore(repo_path, file_scores)
 
 class FileScore:
+    __slots__ = ('file_path', 'debt_items', 'loc', 'debt_score')
+
     def __init__(self, file_path, debt_items, loc):
         self.file_path = file_path
         self.debt_items = debt_items
@@ -1064,38 +1210,30 @@ class FileScore:
         self.debt_score = 0.5  # Mock score for demo
 
 class RepoScore:
+    __slots__ = ('repo_path', 'file_scores', 'debt_score', 'total_debt_items', 'total_loc', 'items_by_type')
+
     def __init__(self, repo_path, file_scores):
         self.repo_path = repo_path
         self.file_scores = file_scores
         self.debt_score = 0.6  # Mock score for demo
         self.total_debt_items = 42  # Mock count for demo
         self.total_loc = 10000  # Mock LOC for demo
-        self.items_by_type = {
-            "long_function": 12,
-            "high_complexity": 8,
-            "code_duplication": 5,
-            "unused_imports": 7,
-            "poor_naming": 10
-        }
+        self.items_by_type = MOCK_ITEMS_BY_TYPE
 
 def analyze_file(path):
     """Mock implementation of debt analysis."""
-    return [
-        {
-            "debt_type": "long_function",
-            "message": "Function is too long (50 lines)",
-            "line_start": 10,
-            "line_end": 60,
-            "severity": 0.8
-        },
-        {
-            "debt_type": "high_complexity",
-            "message": "Function has high cyclomatic complexity (15)",
-            "line_start": 25,
-            "line_end": 40,
-            "severity": 0.7
-        }
-    ]
+    return MOCK_DEBT_ITEMS
+
+def count_lines(data):
+    """Count lines in raw file bytes, including a final line without a trailing newline."""
+    return data.count(b'\n') + (1 if data and not data.endswith(b'\n') else 0)
+
+@functools.lru_cache(maxsize=256)
+def load_file_analysis(path, mtime_ns, size):
+    """Analyze a file and count its lines; keyed by stat so edits miss the cache."""
+    with open(path, 'rb') as f:
+        loc = count_lines(f.read())
+    return analyze_file(path), loc
 
 class LLMOrchestrator:
     pass
@@ -1106,71 +1244,186 @@ class RefactorSuggestion:
 class PatchGenerator:
     pass
 
-# Custom render_template function
+# On-disk bytecode cache so compiled templates survive process restarts. Jinja picks a
+# private per-user directory and verifies its owner. Jinja only checksums the template
+# source, so entries are also keyed by this module's contents; bytecode compiled by
+# another version of this module never matches and is simply not loaded.
+JINJA_CACHE_SUFFIX = '_' + hashlib.sha1(Path(__file__).read_bytes()).hexdigest()[:12] + '.cache'
+JINJA_BYTECODE_CACHE = FileSystemBytecodeCache(pattern='__debtsweeper_%s' + JINJA_CACHE_SUFFIX)
+
+# Jinja environment shared by every request so templates compile once and stay cached
+ENV = Environment(
+    loader=DictLoader(TEMPLATES),
+    bytecode_cache=JINJA_BYTECODE_CACHE,
+    autoescape=select_autoescape(['html']),
+    optimized=True,
+    auto_reload=False,
+    cache_size=-1,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+ENV.globals['css_url'] = CSS_URL
+ENV.globals['how_it_works_steps'] = HOW_IT_WORKS_STEPS
+
+
+@functools.lru_cache(maxsize=None)
+def get_template(template_name):
+    """Return the compiled template, skipping Jinja's loader lookup after the first call."""
+    return ENV.get_template(template_name)
+
+
+# Compile every template at import so forked workers inherit them ready to render
+for _template_name in TEMPLATES:
+    get_template(_template_name)
+
+
 def render_template(template_name, **context):
     """Render a template with the given context."""
-    from flask import Response
-    if template_name not in TEMPLATES:
+    try:
+        template = get_template(template_name)
+    except TemplateNotFound:
         return f"Template {template_name} not found", 404
-    
-    template = TEMPLATES[template_name]
-    
-    # Replace CSS placeholder
-    template = template.replace('{{css}}', CSS)
-    
-    # Replace template variables
-    for key, value in context.items():
-        if isinstance(value, (int, float, str, bool)):
-            template = template.replace('{{ ' + key + ' }}', str(value))
-            template = template.replace('{{' + key + '}}', str(value))
-        # For more complex objects, you'd need Jinja2-like processing
-        
-    # Simple implementation of some Jinja2 syntax
-    # Handle {% if ... %} ... {% else %} ... {% endif %}
-    # This is a very basic implementation that only works for simple cases
-    if 'debt_items' in context:
-        if len(context['debt_items']) > 0:
-            template = template.replace('{% if debt_items %}', '')
-            template = template.replace('{% else %}', '<!--')
-            template = template.replace('{% endif %}', '-->')
+
+    return Response(template.render(**context), mimetype='text/html')
+
+
+def remove_upload_folder(folder, owner_pid):
+    """Delete the upload folder, but only from the process that created it."""
+    # Forked workers run atexit handlers too and must not remove the shared folder
+    if os.getpid() == owner_pid:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+atexit.register(remove_upload_folder, app.config['UPLOAD_FOLDER'], os.getpid())
+
+
+# Shared by every request so concurrent scans cannot oversubscribe the host; its threads
+# start on first use, so a preloading master forks before any exist
+EXTRACT_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix='extract')
+
+
+def member_target(extract_path, name):
+    """Map an archive member name to a path inside extract_path, dropping traversal parts."""
+    name = os.path.splitdrive(name.replace('\\', '/'))[1]
+    parts = [part for part in name.split('/') if part not in ('', '.', '..')]
+    return os.path.join(extract_path, *parts) if parts else None
+
+
+def extract_zip(zip_ref, extract_path):
+    """Extract every archive member, inflating file entries on the shared pool."""
+    files = {}  # Keyed by target so a repeated member name is written once; the last entry wins
+    directories = set()
+    for info in zip_ref.infolist():
+        target = member_target(extract_path, info.filename)
+        if target is None:
+            continue
+        if info.is_dir():
+            directories.add(target)
         else:
-            template = template.replace('{% if debt_items %}', '<!--')
-            template = template.replace('{% else %}', '-->')
-            template = template.replace('{% endif %}', '')
-    
-    # Simple loop handling for debt items
-    if 'debt_items' in context and '{% for item in debt_items %}' in template:
-        debt_items_html = ''
-        for idx, item in enumerate(context['debt_items']):
-            loop_item = template.split('{% for item in debt_items %}')[1].split('{% endfor %}')[0]
-            
-            # Replace loop variables
-            loop_item = loop_item.replace('{{ loop.index0 }}', str(idx))
-            loop_item = loop_item.replace('{{ item.debt_type.replace(\'_\', \' \').title() }}', 
-                                          item['debt_type'].replace('_', ' ').title())
-            loop_item = loop_item.replace('{{ "%.2f"|format(item.severity) }}', f"{item['severity']:.2f}")
-            loop_item = loop_item.replace('{{ item.message }}', item['message'])
-            loop_item = loop_item.replace('{{ item.line_start }}', str(item['line_start']))
-            loop_item = loop_item.replace('{{ item.line_end }}', str(item['line_end']))
-            
-            debt_items_html += loop_item
-        
-        template = template.replace(
-            template.split('{% for item in debt_items %}')[0] + 
-            '{% for item in debt_items %}' + 
-            template.split('{% for item in debt_items %}')[1].split('{% endfor %}')[0] + 
-            '{% endfor %}',
-            template.split('{% for item in debt_items %}')[0] + debt_items_html
-        )
-    
-    # More template processing as needed...
-    
-    return Response(template, mimetype='text/html')
+            directories.add(os.path.dirname(target))
+            files[target] = info
+
+    # Create every directory up front so the workers only ever write files
+    for directory in sorted(directories):
+        os.makedirs(directory, exist_ok=True)
+
+    def extract_member(member):
+        target, info = member
+        with zip_ref.open(info) as source, open(target, 'wb') as dest:
+            shutil.copyfileobj(source, dest)
+
+    list(EXTRACT_POOL.map(extract_member, files.items()))
+
+
+def encode_variants(body):
+    """Compress a response body once and pair each encoding with its ETag."""
+    variants = {'identity': body, 'gzip': gzip.compress(body, 9)}
+    if brotli is not None:
+        variants['br'] = brotli.compress(body, quality=11)
+    return {encoding: (data, hashlib.sha1(data).hexdigest()) for encoding, data in variants.items()}
+
+
+def prerender_page(template_name):
+    """Render a context-free template once and return its encoded variants."""
+    return encode_variants(get_template(template_name).render().encode('utf-8'))
+
+
+# Pages without per-request context, rendered and compressed once at import
+STATIC_PAGES = {name: prerender_page(name) for name in ('index.html', 'scan.html')}
+CSS_VARIANTS = encode_variants(CSS_BYTES)
+
+
+def negotiate_encoding(variants):
+    """Pick the best pre-compressed variant the client accepts."""
+    for encoding in ('br', 'gzip'):
+        if encoding in variants and request.accept_encodings[encoding]:
+            return encoding
+    return 'identity'
+
+
+def serve_precompressed(variants, mimetype, cache_control):
+    """Serve pre-encoded bytes, honouring If-None-Match and Accept-Encoding."""
+    encoding = negotiate_encoding(variants)
+    body, etag = variants[encoding]
+
+    if request.if_none_match.contains_weak(etag):  # If-None-Match uses weak comparison (RFC 7232 §3.2)
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype=mimetype)
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def serve_static_page(template_name):
+    """Serve one of the pre-rendered pages."""
+    # Always revalidate (a cheap 304) so cached pages never reference a retired CSS fingerprint
+    return serve_precompressed(STATIC_PAGES[template_name], 'text/html', 'no-cache')
+
+
+COMPRESSIBLE_MIMETYPES = frozenset(('text/html', 'text/css', 'application/json'))
+COMPRESS_MIN_SIZE = 500  # Smaller bodies gain less than the encoding overhead
+
+
+@app.after_request
+def compress_response(response):
+    """Compress rendered HTML and JSON bodies the client is willing to decode."""
+    if (response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+
+    response.vary.add('Accept-Encoding')
+    if brotli is not None and request.accept_encodings['br']:
+        response.set_data(brotli.compress(body, quality=5))
+        response.headers['Content-Encoding'] = 'br'
+    elif request.accept_encodings['gzip']:
+        response.set_data(gzip.compress(body, 6))
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+
+@app.route('/assets/debtsweeper.<fingerprint>.css')
+def stylesheet(fingerprint):
+    """Serve the shared stylesheet with a long-lived immutable cache policy."""
+    if fingerprint != CSS_FINGERPRINT:
+        return "Stylesheet not found", 404
+
+    return serve_precompressed(CSS_VARIANTS, 'text/css', 'public, max-age=31536000, immutable')
+
 
 @app.route('/')
 def index():
     """Render the dashboard homepage."""
-    return render_template('index.html')
+    return serve_static_page('index.html')
 
 
 @app.route('/scan', methods=['GET', 'POST'])
@@ -1185,16 +1438,15 @@ def scan():
         if repo_zip.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
-        # Save the zip file
-        zip_path = os.path.join(app.config['UPLOAD_FOLDER'], secure_filename(repo_zip.filename))
-        repo_zip.save(zip_path)
-        
-        # Extract the zip file
+        # Extract straight from the upload; Werkzeug already spooled it to a seekable file
         extract_path = os.path.join(app.config['UPLOAD_FOLDER'], 'repo')
         os.makedirs(extract_path, exist_ok=True)
         
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_path)
+        try:
+            with zipfile.ZipFile(repo_zip.stream, 'r') as zip_ref:
+                extract_zip(zip_ref, extract_path)
+        except zipfile.BadZipFile:
+            return jsonify({'error': 'Uploaded file is not a valid zip archive'}), 400
         
         # Scan the repository
         repo_score = scan_repository(extract_path)
@@ -1205,11 +1457,12 @@ def scan():
             'total_debt_items': repo_score.total_debt_items,
             'total_loc': repo_score.total_loc,
             'items_by_type': repo_score.items_by_type,
+            'html_fragment': get_template('_debt_by_type.html').render(items_by_type=repo_score.items_by_type),
             # Add more data as needed
         })
     
     # GET request - show upload form
-    return render_template('scan.html')
+    return serve_static_page('scan.html')
 
 
 @app.route('/file/<path:file_path>')
@@ -1218,26 +1471,26 @@ def view_file(file_path):
     # Convert path to absolute path within extracted repo
     full_path = os.path.join(app.config['UPLOAD_FOLDER'], 'repo', file_path)
     
-    if not os.path.isfile(full_path):
+    try:
+        st = os.stat(full_path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         return jsonify({'error': 'File not found'}), 404
     
-    # Analyze the file
-    debt_items = analyze_file(full_path)
+    # Analyze the file, reusing the previous result while it is unchanged on disk
+    debt_items, loc = load_file_analysis(full_path, st.st_mtime_ns, st.st_size)
     
-    # Count lines of code
-    with open(full_path, 'r') as f:
-        loc = sum(1 for _ in f)
+    # Read the content per request so cached entries never pin whole files in memory
+    try:
+        with open(full_path, 'rb') as f:
+            file_content = f.read().decode('utf-8')
+    except UnicodeDecodeError:
+        file_content = "Unable to read file content"
     
     # Score the file
     file_score = scorer.score_file(file_path, debt_items, loc)
     
-    # Read file content for display
-    try:
-        with open(full_path, 'r') as f:
-            file_content = f.read()
-    except:
-        file_content = "Unable to read file content"
-    
     # Render template with file details
     return render_template(
         'file.html',
@@ -1273,6 +1526,16 @@ def suggest_fixes(file_path):
     })
 
 
+# Placeholder patch body; every slot takes the UTF-8 encoded file path
+PATCH_TEMPLATE = b"""diff --git a/%s b/%s
+--- a/%s
++++ b/%s
+@@ -1,5 +1,5 @@
+-# Example patch
++# Example patched content
+ """
+
+
 @app.route('/patch/<path:file_path>')
 def download_patch(file_path):
     """Download a patch file for fixes."""
@@ -1285,21 +1548,12 @@ def download_patch(file_path):
     # TODO: Implement actual patch generation and download
     # This is a placeholder
     
-    patch_content = f"""diff --git a/{file_path} b/{file_path}
---- a/{file_path}
-+++ b/{file_path}
-@@ -1,5 +1,5 @@
--# Example patch
-+# Example patched content
- """
-    
-    # Create a temporary patch file
-    with tempfile.NamedTemporaryFile(suffix='.patch', delete=False) as temp:
-        temp.write(patch_content.encode('utf-8'))
-        temp_path = temp.name
+    path = file_path.encode('utf-8')
+    patch_content = PATCH_TEMPLATE % (path, path, path, path)
     
+    # Serve the patch from memory; nothing is written to disk
     return send_file(
-        temp_path,
+        io.BytesIO(patch_content),
         as_attachment=True,
         download_name=f"{os.path.basename(file_path)}.patch",
         mimetype='text/plain'
@@ -1322,4 +1576,5 @@ scorer = DebtScorer()
 
 
 if __name__ == '__main__':
+    # Development server only; production deployments run under gunicorn
     app.run(debug=True, host='0.0.0.0', port=5050)
\ No newline at end of file
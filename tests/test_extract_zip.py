@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for archive member sanitising and extraction in standalone_app."""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+import standalone_app
+
+
+class MemberTargetTest(unittest.TestCase):
+    def setUp(self):
+        self.extract_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.extract_path, ignore_errors=True)
+
+    def assert_inside(self, target):
+        root = os.path.realpath(self.extract_path)
+        self.assertEqual(os.path.commonpath([root, os.path.realpath(target)]), root)
+
+    def test_hostile_names_stay_inside_extract_path(self):
+        for name in ('../x', '../../etc/passwd', '/abs', '/abs/x', 'C:\\x', 'C:/x',
+                     'a/../b', 'a/../../b', '..\\..\\x', 'a/./b'):
+            with self.subTest(name=name):
+                target = standalone_app.member_target(self.extract_path, name)
+                self.assertIsNotNone(target)
+                self.assert_inside(target)
+                self.assertNotIn('..', target[len(self.extract_path):].split(os.sep))
+
+    def test_empty_and_dot_names_have_no_target(self):
+        for name in ('', '.', './', '..', '../', '/'):
+            with self.subTest(name=name):
+                self.assertIsNone(standalone_app.member_target(self.extract_path, name))
+
+    def test_plain_names_keep_their_structure(self):
+        target = standalone_app.member_target(self.extract_path, 'pkg/sub/mod.py')
+        self.assertEqual(target, os.path.join(self.extract_path, 'pkg', 'sub', 'mod.py'))
+
+
+class ReversedPool:
+    """Stand-in pool that runs work in reverse order, as a concurrent pool may."""
+
+    def map(self, fn, items):
+        return [fn(item) for item in reversed(list(items))]
+
+
+class ExtractZipTest(unittest.TestCase):
+    def setUp(self):
+        self.extract_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.extract_path, ignore_errors=True)
+
+    def extract(self, members):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, 'w') as zip_ref:
+            for name, data in members:
+                zip_ref.writestr(name, data)
+        buf.seek(0)
+        with zipfile.ZipFile(buf) as zip_ref:
+            standalone_app.extract_zip(zip_ref, self.extract_path)
+
+    def test_duplicate_member_names_keep_the_last_entry(self):
+        with mock.patch.object(standalone_app, 'EXTRACT_POOL', ReversedPool()), \
+                self.assertWarns(UserWarning):  # zipfile warns about the duplicate name
+            self.extract([('pkg/mod.py', 'first\n' * 1000), ('pkg/mod.py', 'last\n')])
+        with open(os.path.join(self.extract_path, 'pkg', 'mod.py')) as f:
+            self.assertEqual(f.read(), 'last\n')
+
+    def test_traversal_members_are_written_inside_extract_path(self):
+        self.extract([('../evil.txt', 'no'), ('/abs/x.txt', 'abs'), ('empty/', '')])
+        parent = os.path.dirname(self.extract_path)
+        self.assertFalse(os.path.exists(os.path.join(parent, 'evil.txt')))
+        self.assertTrue(os.path.isfile(os.path.join(self.extract_path, 'evil.txt')))
+        self.assertTrue(os.path.isfile(os.path.join(self.extract_path, 'abs', 'x.txt')))
+        self.assertTrue(os.path.isdir(os.path.join(self.extract_path, 'empty')))
+
+
+if __name__ == '__main__':
+    unittest.main()